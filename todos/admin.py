@@ -1,11 +1,26 @@
 from django.contrib import admin
+from .caching import invalidate_todo_list
+from .forms import TodoForm
 from .models import Todo
 
 
 @admin.register(Todo)
 class TodoAdmin(admin.ModelAdmin):
+    form = TodoForm
     list_display = ('title', 'completed', 'created_at', 'updated_at')
     list_filter = ('completed', 'created_at')
     search_fields = ('title',)
     readonly_fields = ('created_at', 'updated_at')
     list_editable = ('completed',)
+    
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        invalidate_todo_list()
+    
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        invalidate_todo_list()
+    
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        invalidate_todo_list()
@@ -0,0 +1,44 @@
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+
+TODO_LIST_VERSION_KEY = 'todo_list_ver'
+
+
+def todo_list_cache_enabled():
+    """
+    Return whether the todo list may be cached.
+
+    Caching needs a default cache shared by every worker process (e.g.
+    Memcached or Redis). A per-process LocMemCache is skipped, because a
+    write in one worker could not invalidate the pages cached by another.
+    """
+    return not isinstance(caches[DEFAULT_CACHE_ALIAS], (LocMemCache, DummyCache))
+
+
+def todo_list_version():
+    """
+    Return the current version of the cached todo list.
+    """
+    return cache.get(TODO_LIST_VERSION_KEY, 0)
+
+
+def _bump_todo_list_version():
+    # The version never expires; if it reset to 0, later bumps would reuse
+    # version numbers whose cached pages may still be alive.
+    cache.add(TODO_LIST_VERSION_KEY, 0, timeout=None)
+    try:
+        cache.incr(TODO_LIST_VERSION_KEY)
+    except ValueError:
+        # The key was evicted between add() and incr().
+        cache.set(TODO_LIST_VERSION_KEY, 1, timeout=None)
+
+
+def invalidate_todo_list():
+    """
+    Invalidate cached todo list pages once the current transaction commits.
+    """
+    if todo_list_cache_enabled():
+        transaction.on_commit(_bump_todo_list_version)
@@ -0,0 +1,18 @@
+from django import forms
+from .models import Todo
+
+
+class TodoForm(forms.ModelForm):
+    """
+    A form for creating and editing todo items.
+    """
+    class Meta:
+        model = Todo
+        fields = ['title', 'completed']
+        help_texts = {
+            'title': "The text of the todo item",
+            'completed': "Whether the todo is completed",
+        }
+        error_messages = {
+            'title': {'required': "Title cannot be empty!"},
+        }
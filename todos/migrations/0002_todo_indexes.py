@@ -0,0 +1,21 @@
+# Generated by Django 5.2.9 on 2026-10-15 02:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['-created_at'], name='todos_todo_created_1ddebf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['completed', '-created_at'], name='todos_todo_complet_c202e2_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-15 02:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0002_todo_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(condition=models.Q(('completed', False)), fields=['-created_at'], name='incomplete_created_idx'),
+        ),
+    ]
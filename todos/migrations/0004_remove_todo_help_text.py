@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-15 02:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0003_todo_incomplete_created_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='todo',
+            name='completed',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AlterField(
+            model_name='todo',
+            name='title',
+            field=models.CharField(max_length=200),
+        ),
+    ]
@@ -6,16 +6,28 @@ class Todo(models.Model):
     """
     A model representing a todo item.
     """
-    title = models.CharField(max_length=200, help_text="The text of the todo item")
-    completed = models.BooleanField(default=False, help_text="Whether the todo is completed")
+    title = models.CharField(max_length=200)
+    completed = models.BooleanField(default=False)
+    # Shown by the admin, which reads help text for read-only fields from here.
     created_at = models.DateTimeField(auto_now_add=True, help_text="When the todo was created")
     updated_at = models.DateTimeField(auto_now=True, help_text="When the todo was last updated")
     
+    # Status prefixes for __str__, indexed by the completed flag.
+    _STATUS = ("○ ", "✓ ")
+    
     class Meta:
         ordering = ['-created_at']  # Newest todos first
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['completed', '-created_at']),
+            models.Index(
+                fields=['-created_at'],
+                condition=models.Q(completed=False),
+                name='incomplete_created_idx',
+            ),
+        ]
         verbose_name = "Todo"
         verbose_name_plural = "Todos"
     
     def __str__(self):
-        status = "✓" if self.completed else "○"
-        return f"{status} {self.title}"
+        return self._STATUS[self.completed] + self.title
@@ -1,7 +1,17 @@
-from django.test import TestCase, Client
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, Client, override_settings
+from django.core.cache import cache
 from django.urls import reverse
 from django.contrib.messages import get_messages
+from django.db.models import Case, Value, When
+from django.utils import timezone
+from .caching import TODO_LIST_VERSION_KEY, _bump_todo_list_version
 from .models import Todo
+from .views import TODOS_PER_PAGE
 
 
 class TodoModelTest(TestCase):
@@ -30,9 +40,16 @@ class TodoModelTest(TestCase):
     
     def test_todo_ordering(self):
         """Test that todos are ordered by newest first."""
-        todo1 = Todo.objects.create(title="First Todo")
-        todo2 = Todo.objects.create(title="Second Todo")
-        todo3 = Todo.objects.create(title="Third Todo")
+        titles = ["First Todo", "Second Todo", "Third Todo"]
+        Todo.objects.bulk_create([Todo(title=title) for title in titles])
+        
+        # auto_now_add ignores explicit values, so space the timestamps out
+        # afterwards to keep the ordering deterministic.
+        now = timezone.now()
+        Todo.objects.update(created_at=Case(*[
+            When(title=title, then=Value(now + timedelta(minutes=i)))
+            for i, title in enumerate(titles)
+        ]))
         
         todos = list(Todo.objects.all())
         self.assertEqual(todos[0].title, "Third Todo")
@@ -50,8 +67,7 @@ class TodoListViewTest(TestCase):
     
     def test_list_view_with_todos(self):
         """Test list view displays todos."""
-        Todo.objects.create(title="Todo 1")
-        Todo.objects.create(title="Todo 2")
+        Todo.objects.bulk_create([Todo(title="Todo 1"), Todo(title="Todo 2")])
         
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
@@ -63,6 +79,106 @@ class TodoListViewTest(TestCase):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "No todos yet!")
+    
+    def test_list_view_head(self):
+        """Test list view answers HEAD requests."""
+        response = self.client.head(self.url)
+        self.assertEqual(response.status_code, 200)
+    
+    def test_list_view_post_not_allowed(self):
+        """Test list view rejects POST requests."""
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 405)
+    
+    def test_list_view_paginates(self):
+        """Test list view only renders one page of todos."""
+        Todo.objects.bulk_create(
+            [Todo(title=f"Todo {i}") for i in range(TODOS_PER_PAGE + 1)]
+        )
+        
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['todos']), TODOS_PER_PAGE)
+        self.assertTrue(response.context['todos'].has_next())
+        
+        response = self.client.get(self.url, {'page': 2})
+        self.assertEqual(len(response.context['todos']), 1)
+        
+        response = self.client.get(self.url, {'page': 'last'})
+        self.assertEqual(response.context['todos'].number, 2)
+    
+    def test_list_view_not_cached_with_local_cache(self):
+        """Test the list is not cached when the cache is per-process."""
+        self.client.get(self.url)
+        Todo.objects.create(title="Fresh Todo")
+        
+        response = self.client.get(self.url)
+        self.assertContains(response, "Fresh Todo")
+
+
+class TodoListCacheTest(TestCase):
+    """Test cases for caching the todo list in a shared cache."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Point the default cache at a file-based (shared) backend."""
+        cache_dir = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        shared_cache = override_settings(CACHES={
+            'default': {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': cache_dir,
+            },
+        })
+        shared_cache.enable()
+        cls.addClassCleanup(shared_cache.disable)
+        super().setUpClass()
+    
+    def setUp(self):
+        """Set up test client and start from an empty cache."""
+        cache.clear()
+        self.client = Client()
+        self.url = reverse('todos:todo_list')
+    
+    def test_list_view_out_of_range_page_reuses_last_page(self):
+        """Test out-of-range page numbers share the last page's cache entry."""
+        Todo.objects.create(title="Only Todo")
+        self.client.get(self.url)
+        
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {'page': 999})
+        self.assertEqual(response.context['todos'].number, 1)
+        self.assertContains(response, "Only Todo")
+    
+    def test_list_view_served_from_cache(self):
+        """Test a cached page is rendered without querying the database."""
+        Todo.objects.create(title="Cached Todo")
+        self.client.get(self.url)
+        
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertContains(response, "Cached Todo")
+    
+    def test_list_view_cache_invalidated_on_write(self):
+        """Test writes through the views invalidate the cached list."""
+        self.client.get(self.url)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('todos:todo_create'), {'title': 'Fresh Todo'})
+        
+        response = self.client.get(self.url)
+        self.assertContains(response, "Fresh Todo")
+    
+    def test_version_stored_without_expiry(self):
+        """Test bumping the list version never gives the key a timeout."""
+        with mock.patch('todos.caching.cache') as mock_cache:
+            _bump_todo_list_version()
+            mock_cache.add.assert_called_once_with(TODO_LIST_VERSION_KEY, 0, timeout=None)
+            
+            # Falls back to set() if the key vanished before incr()
+            mock_cache.incr.side_effect = ValueError
+            _bump_todo_list_version()
+            mock_cache.set.assert_called_once_with(TODO_LIST_VERSION_KEY, 1, timeout=None)
 
 
 class TodoCreateViewTest(TestCase):
@@ -94,6 +210,41 @@ class TodoCreateViewTest(TestCase):
         self.assertEqual(len(messages), 1)
         self.assertIn('created successfully', str(messages[0]))
     
+    def test_create_multiple_todos(self):
+        """Test creating several todos from newline-separated titles."""
+        response = self.client.post(self.url, {'title': 'First\n\n  Second  \nThird'})
+        
+        # Should redirect to list view
+        self.assertRedirects(response, reverse('todos:todo_list'))
+        
+        # Blank lines are skipped and titles are stripped
+        self.assertEqual(
+            sorted(Todo.objects.values_list('title', flat=True)),
+            ['First', 'Second', 'Third'],
+        )
+        
+        # Check success message
+        messages = list(get_messages(response.wsgi_request))
+        self.assertEqual(len(messages), 1)
+        self.assertIn('3 todos created successfully', str(messages[0]))
+    
+    def test_create_multiple_todos_title_too_long(self):
+        """Test an over-long title in a batch creates none of the todos."""
+        response = self.client.post(self.url, {'title': 'ok\n\n' + 'x' * 201})
+        
+        # Should not redirect (stays on form, keeping the submitted batch)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'ok\n\n' + 'x' * 201)
+        
+        # No todos should be created
+        self.assertFalse(Todo.objects.exists())
+        
+        # Check error message names the failing line
+        messages = list(get_messages(response.wsgi_request))
+        self.assertEqual(len(messages), 1)
+        self.assertIn('Line 3:', str(messages[0]))
+        self.assertIn('at most 200 characters', str(messages[0]))
+    
     def test_create_todo_empty_title(self):
         """Test creating a todo with empty title shows error."""
         response = self.client.post(self.url, {'title': ''})
@@ -113,11 +264,11 @@ class TodoCreateViewTest(TestCase):
 class TodoUpdateViewTest(TestCase):
     """Test cases for the todo update view."""
     
-    def setUp(self):
-        """Set up test client and test data."""
-        self.client = Client()
-        self.todo = Todo.objects.create(title="Original Todo")
-        self.url = reverse('todos:todo_update', args=[self.todo.pk])
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        cls.todo = Todo.objects.create(title="Original Todo")
+        cls.url = reverse('todos:todo_update', args=[cls.todo.pk])
     
     def test_update_view_get(self):
         """Test GET request shows update form with existing data."""
@@ -162,6 +313,22 @@ class TodoUpdateViewTest(TestCase):
         self.assertEqual(len(messages), 1)
         self.assertIn('cannot be empty', str(messages[0]))
     
+    def test_update_todo_title_too_long(self):
+        """Test updating a todo with an over-long title shows error."""
+        response = self.client.post(self.url, {'title': 'x' * 201})
+        
+        # Should not redirect (stays on form)
+        self.assertEqual(response.status_code, 200)
+        
+        # Todo should not be updated
+        self.todo.refresh_from_db()
+        self.assertEqual(self.todo.title, 'Original Todo')
+        
+        # Check error message
+        messages = list(get_messages(response.wsgi_request))
+        self.assertEqual(len(messages), 1)
+        self.assertIn('at most 200 characters', str(messages[0]))
+    
     def test_update_nonexistent_todo(self):
         """Test updating a non-existent todo returns 404."""
         url = reverse('todos:todo_update', args=[99999])
@@ -172,11 +339,11 @@ class TodoUpdateViewTest(TestCase):
 class TodoDeleteViewTest(TestCase):
     """Test cases for the todo delete view."""
     
-    def setUp(self):
-        """Set up test client and test data."""
-        self.client = Client()
-        self.todo = Todo.objects.create(title="Todo to Delete")
-        self.url = reverse('todos:todo_delete', args=[self.todo.pk])
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        cls.todo = Todo.objects.create(title="Todo to Delete")
+        cls.url = reverse('todos:todo_delete', args=[cls.todo.pk])
     
     def test_delete_view_get(self):
         """Test GET request shows delete confirmation."""
@@ -205,22 +372,29 @@ class TodoDeleteViewTest(TestCase):
         url = reverse('todos:todo_delete', args=[99999])
         response = self.client.get(url)
         self.assertEqual(response.status_code, 404)
+    
+    def test_delete_nonexistent_todo_post(self):
+        """Test POSTing a delete for a non-existent todo returns 404."""
+        url = reverse('todos:todo_delete', args=[99999])
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, 404)
+        self.assertTrue(Todo.objects.filter(pk=self.todo.pk).exists())
 
 
 class TodoToggleViewTest(TestCase):
     """Test cases for the todo toggle view."""
     
-    def setUp(self):
-        """Set up test client and test data."""
-        self.client = Client()
-        self.todo = Todo.objects.create(title="Test Todo", completed=False)
-        self.url = reverse('todos:todo_toggle', args=[self.todo.pk])
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        cls.todo = Todo.objects.create(title="Test Todo", completed=False)
+        cls.url = reverse('todos:todo_toggle', args=[cls.todo.pk])
     
     def test_toggle_incomplete_to_complete(self):
         """Test toggling an incomplete todo to complete."""
         self.assertFalse(self.todo.completed)
         
-        response = self.client.get(self.url)
+        response = self.client.post(self.url)
         
         # Should redirect to list view
         self.assertRedirects(response, reverse('todos:todo_list'))
@@ -239,7 +413,7 @@ class TodoToggleViewTest(TestCase):
         self.todo.completed = True
         self.todo.save()
         
-        response = self.client.get(self.url)
+        response = self.client.post(self.url)
         
         # Should redirect to list view
         self.assertRedirects(response, reverse('todos:todo_list'))
@@ -253,11 +427,32 @@ class TodoToggleViewTest(TestCase):
         self.assertEqual(len(messages), 1)
         self.assertIn('incomplete', str(messages[0]))
     
+    def test_toggle_ajax_returns_no_content(self):
+        """Test toggling from a script client returns 204 without a message."""
+        response = self.client.post(self.url, headers={'HX-Request': 'true'})
+        self.assertEqual(response.status_code, 204)
+        
+        # Todo should be completed
+        self.todo.refresh_from_db()
+        self.assertTrue(self.todo.completed)
+        
+        # No message is queued for the next page load
+        messages = list(get_messages(response.wsgi_request))
+        self.assertEqual(len(messages), 0)
+    
     def test_toggle_nonexistent_todo(self):
         """Test toggling a non-existent todo returns 404."""
         url = reverse('todos:todo_toggle', args=[99999])
-        response = self.client.get(url)
+        response = self.client.post(url)
         self.assertEqual(response.status_code, 404)
+    
+    def test_toggle_get_not_allowed(self):
+        """Test toggling with GET is rejected and leaves the todo unchanged."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 405)
+        
+        self.todo.refresh_from_db()
+        self.assertFalse(self.todo.completed)
 
 
 class TodoURLTest(TestCase):
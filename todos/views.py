@@ -1,31 +1,134 @@
-from django.shortcuts import render, redirect, get_object_or_404
+from functools import lru_cache
+
+from django.shortcuts import render, get_object_or_404
 from django.contrib import messages
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import F
+from django.http import Http404, HttpResponse, HttpResponseRedirect
+from django.urls import reverse
+from django.utils import timezone
+from django.views.decorators.http import require_http_methods, require_POST, require_safe
+from .caching import invalidate_todo_list, todo_list_cache_enabled, todo_list_version
+from .forms import TodoForm
 from .models import Todo
 
 
+TODOS_PER_PAGE = 50
+TODO_CREATE_BATCH_SIZE = 500
+TODO_LIST_CACHE_TIMEOUT = 300
+
+# Toggle success messages, indexed by the new completed flag.
+_TOGGLE_MESSAGES = ('Todo marked as incomplete!', 'Todo marked as completed!')
+
+
+# Helpers. Any existence check here should use .exists() (SELECT ... LIMIT 1)
+# rather than .count(), which aggregates over every matching row.
+
+
+@lru_cache(maxsize=None)
+def _todo_list_url():
+    # Resolved on first use, since the URLconf imports this module.
+    return reverse('todos:todo_list')
+
+
+def _first_error(form):
+    """
+    Return the first validation error of a bound form.
+    """
+    return next(iter(form.errors.values()))[0]
+
+
+def _is_ajax(request):
+    """
+    Return whether the request was sent by htmx or another script client.
+    """
+    return (
+        'HX-Request' in request.headers
+        or request.headers.get('X-Requested-With') == 'XMLHttpRequest'
+    )
+
+
+@require_safe
 def todo_list(request):
     """
-    Display all todos.
+    Display todos, one page at a time.
     """
-    todos = Todo.objects.all()
-    return render(request, 'todos/todo_list.html', {'todos': todos})
+    # Plain dicts are cheaper to build than model instances.
+    queryset = Todo.objects.values('id', 'title', 'completed', 'created_at', 'updated_at')
+    paginator = Paginator(queryset, TODOS_PER_PAGE)
+    
+    cache_enabled = todo_list_cache_enabled()
+    version = todo_list_version() if cache_enabled else None
+    if cache_enabled:
+        count_key = f'todo_list:v{version}:count'
+        count = cache.get(count_key)
+        if count is None:
+            cache.set(count_key, paginator.count, TODO_LIST_CACHE_TIMEOUT)
+        else:
+            paginator.count = count  # Reuse the cached count instead of a COUNT(*)
+    
+    # get_page() clamps the requested page, so only real pages get cached.
+    # Its rows stay a lazy queryset that a cached fragment never evaluates.
+    page_number = request.GET.get('page')
+    if page_number == 'last':
+        page_number = paginator.num_pages
+    todos = paginator.get_page(page_number)
+    return render(request, 'todos/todo_list.html', {
+        'todos': todos,
+        'cache_enabled': cache_enabled,
+        'cache_version': version,
+        'cache_timeout': TODO_LIST_CACHE_TIMEOUT,
+    })
 
 
+@require_http_methods(['GET', 'HEAD', 'POST'])
+@transaction.atomic
 def todo_create(request):
     """
-    Create a new todo item.
+    Create a new todo item, or several at once from newline-separated titles.
     """
     if request.method == 'POST':
-        title = request.POST.get('title', '').strip()
-        if title:
-            Todo.objects.create(title=title)
-            messages.success(request, 'Todo created successfully!')
-            return redirect('todos:todo_list')
+        # (line number, title) pairs, skipping blank lines.
+        lines = [
+            (number, line.strip())
+            for number, line in enumerate(request.POST.get('title', '').splitlines(), 1)
+            if line.strip()
+        ]
+        if len(lines) > 1:
+            forms = [(number, TodoForm(data={'title': title})) for number, title in lines]
+            invalid = next(
+                ((number, form) for number, form in forms if not form.is_valid()),
+                None,
+            )
+            if invalid is None:
+                Todo.objects.bulk_create(
+                    [form.save(commit=False) for _, form in forms],
+                    batch_size=TODO_CREATE_BATCH_SIZE,
+                )
+                invalidate_todo_list()
+                messages.success(request, f'{len(lines)} todos created successfully!')
+                return HttpResponseRedirect(_todo_list_url())
+            number, form = invalid
+            messages.error(request, f'Line {number}: {_first_error(form)}')
         else:
-            messages.error(request, 'Title cannot be empty!')
-    return render(request, 'todos/todo_form.html', {'form_title': 'Create Todo'})
+            form = TodoForm(request.POST)
+            if form.is_valid():
+                form.save()
+                invalidate_todo_list()
+                messages.success(request, 'Todo created successfully!')
+                return HttpResponseRedirect(_todo_list_url())
+            else:
+                messages.error(request, _first_error(form))
+    return render(request, 'todos/todo_form.html', {
+        'form_title': 'Create Todo',
+        'titles': request.POST.get('title', ''),
+    })
 
 
+@require_http_methods(['GET', 'HEAD', 'POST'])
+@transaction.atomic
 def todo_update(request, pk):
     """
     Update an existing todo item.
@@ -33,17 +136,15 @@ def todo_update(request, pk):
     todo = get_object_or_404(Todo, pk=pk)
     
     if request.method == 'POST':
-        title = request.POST.get('title', '').strip()
-        completed = request.POST.get('completed') == 'on'
-        
-        if title:
-            todo.title = title
-            todo.completed = completed
-            todo.save()
+        form = TodoForm(request.POST, instance=todo)
+        if form.is_valid():
+            todo = form.save(commit=False)
+            todo.save(update_fields=['title', 'completed', 'updated_at'])
+            invalidate_todo_list()
             messages.success(request, 'Todo updated successfully!')
-            return redirect('todos:todo_list')
+            return HttpResponseRedirect(_todo_list_url())
         else:
-            messages.error(request, 'Title cannot be empty!')
+            messages.error(request, _first_error(form))
     
     return render(request, 'todos/todo_form.html', {
         'todo': todo,
@@ -51,26 +152,40 @@ def todo_update(request, pk):
     })
 
 
+@require_http_methods(['GET', 'HEAD', 'POST'])
+@transaction.atomic
 def todo_delete(request, pk):
     """
     Delete a todo item.
     """
-    todo = get_object_or_404(Todo, pk=pk)
-    
     if request.method == 'POST':
-        todo.delete()
+        deleted, _ = Todo.objects.filter(pk=pk).delete()
+        if not deleted:
+            raise Http404('No Todo matches the given query.')
+        invalidate_todo_list()
         messages.success(request, 'Todo deleted successfully!')
-        return redirect('todos:todo_list')
+        return HttpResponseRedirect(_todo_list_url())
     
+    todo = get_object_or_404(Todo, pk=pk)
     return render(request, 'todos/todo_confirm_delete.html', {'todo': todo})
 
 
+@require_POST
+@transaction.atomic
 def todo_toggle(request, pk):
     """
     Toggle the completed status of a todo.
     """
-    todo = get_object_or_404(Todo, pk=pk)
-    todo.completed = not todo.completed
-    todo.save()
-    messages.success(request, f'Todo marked as {"completed" if todo.completed else "incomplete"}!')
-    return redirect('todos:todo_list')
+    todos = Todo.objects.filter(pk=pk)
+    # Flip the flag in a single UPDATE rather than a read-modify-write.
+    if not todos.update(completed=~F('completed'), updated_at=timezone.now()):
+        raise Http404('No Todo matches the given query.')
+    invalidate_todo_list()
+    
+    # Script clients update the checkbox themselves; skip the redirect.
+    if _is_ajax(request):
+        return HttpResponse(status=204)
+    
+    completed = todos.values_list('completed', flat=True).get()
+    messages.success(request, _TOGGLE_MESSAGES[completed])
+    return HttpResponseRedirect(_todo_list_url())